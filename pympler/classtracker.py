@@ -567,6 +567,7 @@ class ClassTracker(object):
             if compute_total:
                 snapshot.asizeof_total = asizeof.asizeof(all=True, code=True)
             snapshot.system_total = pympler.process.ProcessMemoryInfo()
+            snapshot.system_total.update_extended()
             snapshot.desc = str(description)
 
             # Compute overhead of all structures, use sizer to exclude tracked
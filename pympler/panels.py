@@ -60,7 +60,9 @@ class MemoryPanel(Panel):
         self.record_stats({'before': ProcessMemoryInfo()})
 
     def process_response(self, request, response):
-        self.record_stats({'after': ProcessMemoryInfo()})
+        after = ProcessMemoryInfo()
+        after.update_extended()
+        self.record_stats({'after': after})
         self._tracker.create_snapshot('after')
         stats = self._tracker.stats
         stats.annotate()
@@ -4,11 +4,10 @@ system. It provides a platform independent layer to get the amount of virtual
 and physical memory allocated to the Python process.
 
 Different mechanisms are implemented: Either the process stat file is read
-(Linux), the `ps` command is executed (BSD/OSX/Solaris) or the resource module
-is queried (Unix fallback). On Windows try to use the win32 module if
-available. If all fails, return 0 for each attribute.
-
-Windows without the win32 module is not supported.
+(Linux), libproc is queried through ctypes (macOS), the `ps` command is
+executed (BSD/Solaris) or the resource module is queried (Unix fallback). On
+Windows the win32 API is called through ctypes. If all fails, return 0 for
+each attribute.
 
     >>> from pympler.process import ProcessMemoryInfo
     >>> pmi = ProcessMemoryInfo()
@@ -17,13 +16,20 @@ Windows without the win32 module is not supported.
 """
 
 import logging
+import re
+import sys
 import threading
 
+from collections import namedtuple
+from time import time
+
 try:
     from thread import get_ident
 except ImportError:
     from _thread import get_ident  # NOQA
 
+import os
+
 from os import getpid
 from subprocess import Popen, PIPE
 
@@ -35,6 +41,172 @@ except ImportError:
     _getpagesize = lambda: 4096
 
 
+if hasattr(os, 'pread'):
+    def _pread(fd, size):
+        """Read `size` bytes from the start of `fd` in a single syscall."""
+        return os.pread(fd, size, 0)
+else:  # pragma: no cover
+    def _pread(fd, size):
+        """Read `size` bytes from the start of `fd` (pread emulation)."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, size)
+
+
+def _read_file(path, size):
+    """Read up to `size` bytes from `path` in a single syscall."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+_PS_RE = re.compile(br'(\d+)\s+(\d+)\s*$')
+
+_STATUS_RE = re.compile(
+    br'(VmPeak|VmSize|VmLck|VmHWM|VmRSS|VmStk|VmData|VmExe|VmLib|VmPTE):'
+    br'\s+(\d+)\s+kB', re.M)
+
+
+# File descriptors for the stat and statm files of this process. They are
+# opened lazily on first use, kept open for the lifetime of the process and
+# shared by all sampler instances - the files always describe the calling
+# process, no matter which instance reads them.
+_statm_fd = -1
+_stat_fd = -1
+
+# Probed once at import. On platforms without procfs this turns every sample
+# attempt into a single boolean check instead of constructing and swallowing
+# an OSError per call.
+_PROCFS_AVAILABLE = os.path.exists('/proc/self/statm')
+
+
+def _open_proc_fds():
+    """Open the cached stat/statm file descriptors if necessary. Returns
+    true if the descriptors are usable."""
+    global _statm_fd, _stat_fd
+    if not _PROCFS_AVAILABLE:
+        return False
+    if not _HAS_FORK_HOOK:  # pragma: no cover
+        _ensure_current_process()
+    if _statm_fd < 0:
+        # Open into locals and publish both descriptors only after both
+        # opens succeeded. Readers gate on _statm_fd alone, so assigning
+        # _stat_fd first guarantees a thread that sees a valid _statm_fd
+        # never preads from a still unopened _stat_fd.
+        try:
+            statm_fd = os.open('/proc/self/statm', os.O_RDONLY)
+        except OSError:  # pragma: no cover
+            return False
+        try:
+            stat_fd = os.open('/proc/self/stat', os.O_RDONLY)
+        except OSError:  # pragma: no cover
+            os.close(statm_fd)
+            return False
+        if _statm_fd < 0:
+            _stat_fd = stat_fd
+            _statm_fd = statm_fd
+        else:  # pragma: no cover
+            # Another thread won the race; discard the duplicate pair.
+            os.close(statm_fd)
+            os.close(stat_fd)
+    return True
+
+
+def _close_proc_fds():
+    """Close the cached stat/statm file descriptors. They are reopened on
+    the next sample."""
+    global _statm_fd, _stat_fd
+    if _statm_fd >= 0:
+        os.close(_statm_fd)
+        _statm_fd = -1
+    if _stat_fd >= 0:
+        os.close(_stat_fd)
+        _stat_fd = -1
+
+
+# Instantiating a sampler in a tight polling loop should not pay a getpid
+# syscall each time. The cached pid is refreshed in the child after a fork,
+# together with the proc descriptors which still refer to the parent there.
+_OWN_PID = getpid()
+
+
+def _after_fork_in_child():
+    """Refresh the cached pid and drop the cached proc file descriptors in
+    the child process after a fork."""
+    global _OWN_PID
+    _OWN_PID = getpid()
+    _close_proc_fds()
+
+
+_HAS_FORK_HOOK = hasattr(os, 'register_at_fork')
+
+if _HAS_FORK_HOOK:  # pragma: no branch
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _ensure_current_process():
+    """Invalidate the cached pid and proc descriptors if the process forked
+    on an interpreter without os.register_at_fork (pre-3.7). Without this a
+    forked child would keep reporting the parent's memory metrics."""
+    if _OWN_PID != getpid():  # pragma: no cover
+        _after_fork_in_child()
+
+
+ProcessMemorySnapshot = namedtuple('ProcessMemorySnapshot',
+                                   ['vsz', 'rss', 'pagefaults',
+                                    'data_segment', 'code_segment',
+                                    'shared_segment', 'stack_segment'])
+
+
+def _fast_parse_statm(buf):
+    """
+    Extract the page counts from the contents of a statm file. The six fixed
+    fields are walked with `buf.find` and only the five fields of interest
+    are sliced and converted, so no list of all fields is ever built.
+    Returns `(size, resident, shared, text, data)`.
+    """
+    find = buf.find
+    end = find(b' ')
+    size = int(buf[:end])
+    pos = end + 1
+    end = find(b' ', pos)
+    resident = int(buf[pos:end])
+    pos = end + 1
+    end = find(b' ', pos)
+    shared = int(buf[pos:end])
+    pos = end + 1
+    end = find(b' ', pos)
+    text = int(buf[pos:end])
+    pos = find(b' ', end + 1) + 1  # skip the lib field
+    data = int(buf[pos:find(b' ', pos)])
+    return size, resident, shared, text, data
+
+
+def _fast_parse_stat(buf):
+    """
+    Extract virtual size, resident size and major pagefault count from the
+    contents of a process' stat file. The comm field may contain spaces and
+    parentheses so scanning starts after the closing parenthesis. Fields are
+    walked up to the resident size (field 23) and the roughly 30 remaining
+    fields are never split. Returns `(vsz, rss_pages, majflt)`.
+    """
+    find = buf.find
+    pos = buf.rindex(b')') + 2
+    for _ in range(9):  # skip fields 2..10
+        pos = find(b' ', pos) + 1
+    end = find(b' ', pos)  # field 11: majflt
+    majflt = int(buf[pos:end])
+    pos = end + 1
+    for _ in range(10):  # skip fields 12..21
+        pos = find(b' ', pos) + 1
+    end = find(b' ', pos)  # field 22: vsize
+    vsz = int(buf[pos:end])
+    pos = end + 1
+    rss_pages = int(buf[pos:find(b' ', pos)])  # field 23: rss
+    return vsz, rss_pages, majflt
+
+
 class _ProcessMemoryInfo(object):
     """Stores information about various process-level memory metrics. The
     virtual size is stored in attribute `vsz`, the physical memory allocated to
@@ -46,14 +218,20 @@ class _ProcessMemoryInfo(object):
     module.
     """
 
+    __slots__ = ('pid', 'rss', 'vsz', 'pagefaults', '_os_specific',
+                 'data_segment', 'code_segment', 'shared_segment',
+                 'stack_segment', 'available')
+
     pagesize = _getpagesize()
 
     def __init__(self):
-        self.pid = getpid()
+        if not _HAS_FORK_HOOK:  # pragma: no cover
+            _ensure_current_process()
+        self.pid = _OWN_PID
         self.rss = 0
         self.vsz = 0
         self.pagefaults = 0
-        self.os_specific = []
+        self._os_specific = None
 
         self.data_segment = 0
         self.code_segment = 0
@@ -73,6 +251,31 @@ class _ProcessMemoryInfo(object):
         """
         return False  # pragma: no cover
 
+    def update_extended(self):
+        """
+        Refresh the information including metrics which are expensive to
+        collect and rarely needed, like the OS specific metrics listed in
+        `os_specific`. Equivalent to `update` unless a platform
+        implementation distinguishes both.
+        """
+        return self.update()
+
+    @property
+    def os_specific(self):
+        """
+        List of OS specific memory metrics as (description, value) tuples.
+        The list is populated lazily on first access so callers which only
+        sample `rss` and `vsz` never pay for collecting it.
+        """
+        if self._os_specific is None:
+            self._os_specific = self._get_os_specific()
+        return self._os_specific
+
+    def _get_os_specific(self):
+        """Collect the OS specific metrics. Overridden by implementations
+        which can provide them."""
+        return []
+
     def __sub__(self, other):
         diff = [('Resident set size (delta)', self.rss - other.rss),
                 ('Virtual size (delta)', self.vsz - other.vsz),
@@ -86,12 +289,17 @@ ProcessMemoryInfo = _ProcessMemoryInfo
 def is_available():
     """
     Convenience function to check if the current platform is supported by this
-    module.
+    module. The module-level probing already selected a working
+    implementation so no instance needs to be created (and no proc file read
+    or `ps` process forked) to answer this.
     """
-    return ProcessMemoryInfo().update()
+    return ProcessMemoryInfo is not _ProcessMemoryInfo
 
 
 class _ProcessMemoryInfoPS(_ProcessMemoryInfo):
+
+    __slots__ = ()
+
     def update(self):
         """
         Get virtual and resident size of current process via 'ps'.
@@ -99,78 +307,265 @@ class _ProcessMemoryInfoPS(_ProcessMemoryInfo):
         successful.
         """
         try:
-            p = Popen(['/bin/ps', '-p%s' % self.pid, '-o', 'rss,vsz'],
+            # The trailing '=' suppresses the header line so the output is
+            # just the two numbers of interest.
+            p = Popen(['/bin/ps', '-p%s' % self.pid, '-o', 'rss=,vsz='],
                       stdout=PIPE, stderr=PIPE)
         except OSError:  # pragma: no cover
             pass
         else:
-            s = p.communicate()[0].split()
-            if p.returncode == 0 and len(s) >= 2:  # pragma: no branch
-                self.vsz = int(s[-1]) * 1024
-                self.rss = int(s[-2]) * 1024
-                return True
+            out = p.communicate()[0]
+            if p.returncode == 0:  # pragma: no branch
+                match = _PS_RE.search(out)
+                if match:  # pragma: no branch
+                    self.rss = int(match.group(1)) * 1024
+                    self.vsz = int(match.group(2)) * 1024
+                    return True
         return False  # pragma: no cover
 
 
-class _ProcessMemoryInfoProc(_ProcessMemoryInfo):
+class _ProcessMemoryInfoStatm(_ProcessMemoryInfo):
+    """Sample the cheap mandatory metrics from the process' statm file and
+    only read the stat and status files when extended metrics are requested
+    via `update_extended`. This is the default implementation on Linux.
+    """
+
+    __slots__ = ()
 
     key_map = {
-        'VmPeak': 'Peak virtual memory size',
-        'VmSize': 'Virtual memory size',
-        'VmLck':  'Locked memory size',
-        'VmHWM':  'Peak resident set size',
-        'VmRSS':  'Resident set size',
-        'VmStk':  'Size of stack segment',
-        'VmData': 'Size of data segment',
-        'VmExe':  'Size of code segment',
-        'VmLib':  'Shared library code size',
-        'VmPTE':  'Page table entries size',
+        b'VmPeak': 'Peak virtual memory size',
+        b'VmSize': 'Virtual memory size',
+        b'VmLck':  'Locked memory size',
+        b'VmHWM':  'Peak resident set size',
+        b'VmRSS':  'Resident set size',
+        b'VmStk':  'Size of stack segment',
+        b'VmData': 'Size of data segment',
+        b'VmExe':  'Size of code segment',
+        b'VmLib':  'Shared library code size',
+        b'VmPTE':  'Page table entries size',
+    }
+
+    segment_map = {
+        b'VmData': 'data_segment',
+        b'VmExe':  'code_segment',
+        b'VmLib':  'shared_segment',
+        b'VmStk':  'stack_segment',
     }
 
+    # How long parsed status file values are reused before the file is read
+    # again. The code and shared library segments only change on exec or
+    # dlopen, so they are effectively constant between samples.
+    _SEG_CACHE_TTL = 5.0
+
+    # (timestamp, {attribute: size}, os_specific) shared by all instances.
+    _status_cache = None
+
+    def _parse_statm(self):
+        """
+        Read virtual size, resident size and segment sizes from the process'
+        statm file. The file holds a single line of page counts and is much
+        cheaper to parse than the status file. Returns true if the file could
+        be read.
+        """
+        if not _open_proc_fds():  # pragma: no cover
+            return False
+        try:
+            buf = _pread(_statm_fd, 4096)
+        except OSError:  # pragma: no cover
+            return False
+        pagesize = self.pagesize
+        size, resident, shared, text, data = _fast_parse_statm(buf)
+        self.vsz = size * pagesize
+        self.rss = resident * pagesize
+        self.shared_segment = shared * pagesize
+        self.code_segment = text * pagesize
+        # The data field accounts for the data and stack segments combined.
+        self.data_segment = data * pagesize
+        return True
+
+    def _parse_status(self, force=False):
+        """
+        Parse the process' status file for segment sizes and OS specific
+        metrics like the peak virtual memory size. A single precompiled
+        regex pass over the file replaces per-line splitting. The parsed
+        values are cached for `_SEG_CACHE_TTL` seconds and shared by all
+        instances; pass `force` to bypass the cache.
+        """
+        cache = _ProcessMemoryInfoStatm._status_cache
+        now = time()
+        if force or cache is None or now - cache[0] >= self._SEG_CACHE_TTL:
+            try:
+                data = _read_file('/proc/self/status', 32768)
+            except OSError:  # pragma: no cover
+                return
+            segments = {}
+            os_specific = []
+            for key, value in _STATUS_RE.findall(data):
+                size = int(value) * 1024
+                attr = self.segment_map.get(key)
+                if attr:
+                    segments[attr] = size
+                os_specific.append((self.key_map[key], pp(size)))
+            cache = (now, segments, os_specific)
+            _ProcessMemoryInfoStatm._status_cache = cache
+        for attr, size in cache[1].items():
+            setattr(self, attr, size)
+        self._os_specific = list(cache[2])
+
+    def _get_os_specific(self):
+        """Parse the status file on first access of `os_specific`."""
+        self._parse_status()
+        return self._os_specific or []
+
+    @classmethod
+    def snapshot(cls):
+        """
+        Take a point-in-time snapshot of all process memory metrics with a
+        single pread of the statm file and a single pread of the stat file.
+        The sizes accounted in the stat file take precedence over the statm
+        figures - the resident field in statm may include additional shared
+        pages on some kernels. statm folds the stack into the data segment
+        so `stack_segment` is always zero in a snapshot. Returns a
+        `ProcessMemorySnapshot` or None if the proc files cannot be read.
+        """
+        if not _open_proc_fds():  # pragma: no cover
+            return None
+        try:
+            statm = _pread(_statm_fd, 4096)
+            stat = _pread(_stat_fd, 8192)
+        except OSError:  # pragma: no cover
+            return None
+        pagesize = cls.pagesize
+        vsz, rss_pages, pagefaults = _fast_parse_stat(stat)
+        _, _, shared, text, data = _fast_parse_statm(statm)
+        return ProcessMemorySnapshot(vsz=vsz,
+                                     rss=rss_pages * pagesize,
+                                     pagefaults=pagefaults,
+                                     data_segment=data * pagesize,
+                                     code_segment=text * pagesize,
+                                     shared_segment=shared * pagesize,
+                                     stack_segment=0)
+
+    def _copy_snapshot(self):
+        """Copy the fields of a full snapshot into this instance. Returns
+        true if a snapshot could be taken."""
+        meminfo = self.snapshot()
+        if meminfo is None:  # pragma: no cover
+            return False
+        self.vsz = meminfo.vsz
+        self.rss = meminfo.rss
+        self.pagefaults = meminfo.pagefaults
+        self.data_segment = meminfo.data_segment
+        self.code_segment = meminfo.code_segment
+        self.shared_segment = meminfo.shared_segment
+        self.stack_segment = meminfo.stack_segment
+        return True
+
     def update(self):
         """
-        Get virtual size of current process by reading the process' stat file.
+        Get memory metrics of the current process by reading its statm file.
         This should work for Linux.
         """
-        try:
-            stat = open('/proc/self/stat')
-            status = open('/proc/self/status')
-        except IOError:  # pragma: no cover
+        return self._parse_statm()
+
+    def update_extended(self, force=False):
+        """
+        Additionally read the stat and status files for the pagefault count
+        and the OS specific metrics. The rss, vsz and pagefault figures are
+        always refreshed; pass `force` to also bypass the cache of status
+        file values.
+        """
+        if not self._copy_snapshot():
+            return False  # pragma: no cover
+        self._parse_status(force)
+        return True
+
+
+class _ProcessMemoryInfoProc(_ProcessMemoryInfoStatm):
+    """Read every metric on each sample. Use this implementation directly
+    when segment sizes and pagefault counts need to be refreshed per call.
+    """
+
+    __slots__ = ()
+
+    def update(self, extended=False, force=False):
+        """
+        Get memory metrics of the current process by reading its statm and
+        stat files. This should work for Linux. The status file which
+        provides the OS specific metrics is comparatively expensive to parse
+        and only read if `extended` is set; pass `force` to also bypass the
+        cache of status file values.
+        """
+        if not self._copy_snapshot():
+            return False  # pragma: no cover
+        if extended:
+            self._parse_status(force)
+        return True
+
+
+if sys.platform == 'darwin':  # pragma: no cover
+    import ctypes
+    import ctypes.util
+
+    class _proc_taskinfo(ctypes.Structure):
+        _fields_ = [('pti_virtual_size', ctypes.c_uint64),
+                    ('pti_resident_size', ctypes.c_uint64),
+                    ('pti_total_user', ctypes.c_uint64),
+                    ('pti_total_system', ctypes.c_uint64),
+                    ('pti_threads_user', ctypes.c_uint64),
+                    ('pti_threads_system', ctypes.c_uint64),
+                    ('pti_policy', ctypes.c_int32),
+                    ('pti_faults', ctypes.c_int32),
+                    ('pti_pageins', ctypes.c_int32),
+                    ('pti_cow_faults', ctypes.c_int32),
+                    ('pti_messages_sent', ctypes.c_int32),
+                    ('pti_messages_received', ctypes.c_int32),
+                    ('pti_syscalls_mach', ctypes.c_int32),
+                    ('pti_syscalls_unix', ctypes.c_int32),
+                    ('pti_csw', ctypes.c_int32),
+                    ('pti_threadnum', ctypes.c_int32),
+                    ('pti_numrunning', ctypes.c_int32),
+                    ('pti_priority', ctypes.c_int32)]
+
+    _PROC_PIDTASKINFO = 4
+
+    try:
+        _libproc = ctypes.CDLL(ctypes.util.find_library('proc'))
+        _libproc.proc_pidinfo.argtypes = [ctypes.c_int, ctypes.c_int,
+                                          ctypes.c_uint64, ctypes.c_void_p,
+                                          ctypes.c_int]
+    except (OSError, AttributeError):
+        _libproc = None
+
+    class _ProcessMemoryInfoLibproc(_ProcessMemoryInfo):
+
+        __slots__ = ()
+
+        def update(self):
+            """
+            Get virtual and resident size of the current process via
+            libproc's `proc_pidinfo`. Unlike the `ps` fallback this does not
+            fork a new process per sample.
+            """
+            taskinfo = _proc_taskinfo()
+            size = ctypes.sizeof(taskinfo)
+            ret = _libproc.proc_pidinfo(self.pid, _PROC_PIDTASKINFO, 0,
+                                        ctypes.byref(taskinfo), size)
+            if ret == size:
+                self.vsz = taskinfo.pti_virtual_size
+                self.rss = taskinfo.pti_resident_size
+                self.pagefaults = taskinfo.pti_faults
+                return True
             return False
-        else:
-            stats = stat.read().split()
-            self.vsz = int(stats[22])
-            self.rss = int(stats[23]) * self.pagesize
-            self.pagefaults = int(stats[11])
-
-            for entry in status.readlines():
-                try:
-                    key, value = entry.split(':', 1)
-                except ValueError:
-                    continue
-                value = value.strip()
-                size_in_bytes = lambda x: int(x.split()[0]) * 1024
-                if key == 'VmData':
-                    self.data_segment = size_in_bytes(value)
-                elif key == 'VmExe':
-                    self.code_segment = size_in_bytes(value)
-                elif key == 'VmLib':
-                    self.shared_segment = size_in_bytes(value)
-                elif key == 'VmStk':
-                    self.stack_segment = size_in_bytes(value)
-                key = self.key_map.get(key)
-                if key:
-                    self.os_specific.append((key, pp(size_in_bytes(value))))
-
-            stat.close()
-            status.close()
-            return True
 
 
 try:
     from resource import getrusage, RUSAGE_SELF
 
     class _ProcessMemoryInfoResource(_ProcessMemoryInfo):
+
+        __slots__ = ()
+
         def update(self):
             """
             Get memory metrics of current process through `getrusage`.  Only
@@ -193,37 +588,102 @@ try:
             self.pagefaults = usage.ru_majflt
             return self.rss != 0
 
-    if _ProcessMemoryInfoProc().update():  # pragma: no branch
-        ProcessMemoryInfo = _ProcessMemoryInfoProc
+    if _PROCFS_AVAILABLE:  # pragma: no branch
+        ProcessMemoryInfo = _ProcessMemoryInfoStatm
+    elif (sys.platform == 'darwin' and _libproc and
+            _ProcessMemoryInfoLibproc().update()):  # pragma: no cover
+        ProcessMemoryInfo = _ProcessMemoryInfoLibproc
     elif _ProcessMemoryInfoPS().update():  # pragma: no cover
         ProcessMemoryInfo = _ProcessMemoryInfoPS
-    elif _ProcessMemoryInfoResource().update():  # pragma: no cover
+    elif (sys.platform.startswith(('freebsd', 'openbsd', 'netbsd')) and
+            _ProcessMemoryInfoResource().update()):  # pragma: no cover
+        # getrusage leaves most fields unset on other platforms (notably
+        # Linux), so probing it there would waste a syscall at import just
+        # to learn that it reports nothing useful.
         ProcessMemoryInfo = _ProcessMemoryInfoResource
 
-except ImportError:
+except ImportError:  # pragma: no cover
     try:
-        # Requires pywin32
-        from win32process import GetProcessMemoryInfo
-        from win32api import GetCurrentProcess, GlobalMemoryStatusEx
-    except ImportError:
-        logging.warn("Please install pywin32 when using pympler on Windows.")
+        import ctypes
+
+        from ctypes import windll, wintypes
+
+        _kernel32 = windll.kernel32
+        _psapi = windll.psapi
+    except (ImportError, AttributeError):
+        logging.warning("Windows API not available, cannot read process "
+                        "memory metrics.")
     else:
+        class _PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD),
+                        ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t),
+                        ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t),
+                        ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        class _MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [('dwLength', wintypes.DWORD),
+                        ('dwMemoryLoad', wintypes.DWORD),
+                        ('ullTotalPhys', ctypes.c_uint64),
+                        ('ullAvailPhys', ctypes.c_uint64),
+                        ('ullTotalPageFile', ctypes.c_uint64),
+                        ('ullAvailPageFile', ctypes.c_uint64),
+                        ('ullTotalVirtual', ctypes.c_uint64),
+                        ('ullAvailVirtual', ctypes.c_uint64),
+                        ('ullAvailExtendedVirtual', ctypes.c_uint64)]
+
         class _ProcessMemoryInfoWin32(_ProcessMemoryInfo):
+
+            __slots__ = ('_counters', '_memstatus')
+
+            # GetCurrentProcess returns a pseudo handle which stays valid
+            # for the lifetime of the process and does not need closing.
+            _handle = _kernel32.GetCurrentProcess()
+            _GetProcessMemoryInfo = _psapi.GetProcessMemoryInfo
+            _GlobalMemoryStatusEx = _kernel32.GlobalMemoryStatusEx
+
+            def __init__(self):
+                self._counters = _PROCESS_MEMORY_COUNTERS()
+                self._counters.cb = ctypes.sizeof(self._counters)
+                self._memstatus = _MEMORYSTATUSEX()
+                self._memstatus.dwLength = ctypes.sizeof(self._memstatus)
+                _ProcessMemoryInfo.__init__(self)
+
             def update(self):
-                process_handle = GetCurrentProcess()
-                meminfo = GetProcessMemoryInfo(process_handle)
-                memstatus = GlobalMemoryStatusEx()
-                self.vsz = (memstatus['TotalVirtual'] -
-                            memstatus['AvailVirtual'])
-                self.rss = meminfo['WorkingSetSize']
-                self.pagefaults = meminfo['PageFaultCount']
+                """
+                Get memory metrics of the current process by calling the
+                psapi/kernel32 functions directly through ctypes. The
+                process handle and the counter structures are created once
+                and reused for every sample.
+                """
+                counters = self._counters
+                memstatus = self._memstatus
+                if not self._GetProcessMemoryInfo(self._handle,
+                                                  ctypes.byref(counters),
+                                                  counters.cb):
+                    return False
+                if not self._GlobalMemoryStatusEx(ctypes.byref(memstatus)):
+                    return False
+                self.vsz = (memstatus.ullTotalVirtual -
+                            memstatus.ullAvailVirtual)
+                self.rss = counters.WorkingSetSize
+                self.pagefaults = counters.PageFaultCount
                 return True
 
         ProcessMemoryInfo = _ProcessMemoryInfoWin32
 
 
 class ThreadInfo(object):
-    """Collect information about an active thread."""
+    """Collect information about an active thread. The `ident`, `name` and
+    `daemon` properties exist on every supported Python version so they are
+    read directly without per-thread capability probing."""
+
+    __slots__ = ('ident', 'name', 'daemon')
 
     def __init__(self, thread):
         self.ident = thread.ident
@@ -231,9 +691,24 @@ class ThreadInfo(object):
         self.daemon = thread.daemon
 
 
+def iter_current_threads():
+    """Lazily yield a `ThreadInfo` object per active thread. Callers which
+    stop iterating early do not pay for the remaining threads."""
+    for thread in threading.enumerate():
+        yield ThreadInfo(thread)
+
+
 def get_current_threads():
     """Get a list of `ThreadInfo` objects."""
-    return [ThreadInfo(thread) for thread in threading.enumerate()]
+    return list(iter_current_threads())
+
+
+def get_current_threads_raw():
+    """Get a list of `(ident, name, daemon)` tuples per active thread. This
+    skips the `ThreadInfo` object creation for callers which only need the
+    primitive values."""
+    return [(thread.ident, thread.name, thread.daemon)
+            for thread in threading.enumerate()]
 
 
 def get_current_thread_id():
@@ -97,6 +97,7 @@ bottle.TEMPLATE_PATH.append(static_files)
 def root():
     """Get overview."""
     pmi = ProcessMemoryInfo()
+    pmi.update_extended()
     return dict(processinfo=pmi)
 
 
@@ -105,6 +106,7 @@ def root():
 def process():
     """Get process overview."""
     pmi = ProcessMemoryInfo()
+    pmi.update_extended()
     threads = get_current_threads()
     return dict(info=pmi, threads=threads)
 
@@ -91,6 +91,19 @@ class ProcessMemoryTests(unittest.TestCase):
                 self.assert_(resinfo.rss >= procinfo.rss)
 
 
+    def test_statm_vs_proc_sizes(self):
+        '''Test process sizes match: statm fast path vs full proc read
+        '''
+        statminfo = process._ProcessMemoryInfoStatm()
+        procinfo = process._ProcessMemoryInfoProc()
+        self._match_sizes(statminfo, procinfo, ignore=['stack_segment'])
+        if statminfo.available:
+            # os_specific is populated lazily on first access.
+            self.assertTrue(statminfo.os_specific)
+            self.assertTrue(statminfo.update_extended())
+            self.assertTrue(statminfo.os_specific)
+
+
     def test_get_current_threads(self):
         '''Test thread info is extracted.'''
         tinfos = process.get_current_threads()
@@ -101,19 +114,57 @@ class ProcessMemoryTests(unittest.TestCase):
             self.failIfEqual(tinfo.ident, 0)
 
 
+    def test_get_current_threads_raw(self):
+        '''Test raw thread info tuples match the ThreadInfo objects.'''
+        idents = set(tinfo.ident for tinfo in process.iter_current_threads())
+        for ident, name, daemon in process.get_current_threads_raw():
+            self.assertEqual(type(ident), int)
+            self.assertEqual(type(name), type(''))
+            self.assertEqual(type(daemon), type(True))
+            self.assertTrue(ident in idents)
+
+
     def test_proc(self):
         '''Test reading proc stats with mock data.'''
         if mock is None:
             return
-        mock_stat = mock.mock_open(read_data='22411 (cat) R 22301 22411 22301 34818 22411 4194304 82 0 0 0 0 0 0 0 20 0 1 0 709170 8155136 221 18446744073709551615 94052544688128 94052544719312 140729623469552 0 0 0 0 0 0 0 0 0 17 6 0 0 0 0 0 94052546816624 94052546818240 94052566347776 140729623473446 140729623473466 140729623473466 140729623478255 0')
-        mock_status = mock.mock_open(read_data='Name:  cat\n\nVmData:    2 kB\nMultiple colons: 1:1')
-        with mock.patch('builtins.open', new_callable=mock.mock_open) as mock_file:
-            mock_file.side_effect = [mock_stat.return_value, mock_status.return_value]
+        pagesize = process._ProcessMemoryInfoProc.pagesize
+        with mock.patch.object(process, '_open_proc_fds',
+                               return_value=True), \
+                mock.patch.object(process, '_pread') as mock_pread:
+            mock_pread.side_effect = [
+                b'1991 221 178 8 0 1041 0',
+                b'22411 (cat) R 22301 22411 22301 34818 22411 4194304 82 0 7 0 0 0 0 0 20 0 1 0 709170 8155136 221 18446744073709551615 94052544688128 94052544719312 140729623469552 0 0 0 0 0 0 0 0 0 17 6 0 0 0 0 0 94052546816624 94052546818240 94052566347776 140729623473446 140729623473466 140729623473466 140729623478255 0',
+            ]
             procinfo = process._ProcessMemoryInfoProc()
         self.assertTrue(procinfo.available)
+        # vsz is taken from the stat file which accounts it in bytes.
         self.assertEqual(procinfo.vsz, 8155136)
-        if sys.version_info >= (3, 4):  # Python 3.3 doesn't support mock_open.readlines
-            self.assertEqual(procinfo.data_segment, 2048)
+        self.assertEqual(procinfo.rss, 221 * pagesize)
+        self.assertEqual(procinfo.code_segment, 8 * pagesize)
+        self.assertEqual(procinfo.pagefaults, 7)
+
+    def test_proc_extended(self):
+        '''Test the extended parsing of the status file with mock data.'''
+        if mock is None:
+            return
+        mock_status = b'Name:  cat\n\nVmData:    2 kB\nMultiple colons: 1:1'
+        # Keep mock values out of the shared status cache.
+        process._ProcessMemoryInfoStatm._status_cache = None
+        self.addCleanup(setattr, process._ProcessMemoryInfoStatm,
+                        '_status_cache', None)
+        procinfo = process._ProcessMemoryInfoProc()
+        with mock.patch.object(process, '_open_proc_fds',
+                               return_value=True), \
+                mock.patch.object(process, '_pread') as mock_pread, \
+                mock.patch.object(process, '_read_file',
+                                  return_value=mock_status):
+            mock_pread.side_effect = [
+                b'1991 221 178 8 0 1041 0',
+                b'22411 (cat) R 22301 22411 22301 34818 22411 4194304 82 0 7 0 0 0 0 0 20 0 1 0 709170 8155136 221 0 0 0 0 0 0 0 0 0 0 0 0 0 17 6 0 0 0 0 0 0 0 0 0 0 0 0 0',
+            ]
+            self.assertTrue(procinfo.update(extended=True))
+        self.assertEqual(procinfo.data_segment, 2048)
 
 
 if __name__ == "__main__":